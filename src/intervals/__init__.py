@@ -1,43 +1,69 @@
 from intervals.intervals import (
     EMPTY_SET,
     NATURALS,
+    NEGATIVE_REALS,
+    NEGATIVE_UNIT,
     PI,
     POSITIVE_REALS,
+    REALS,
     UNIT,
     UNIT_DISK,
     WHOLE_NUMBERS,
     Bounds,
     Interval,
+    IntervalArray,
     IntervalError,
+    IntervalIndex,
     IntervalType,
     IntervalTypeError,
     IntervalValueError,
     Number,
     clamp,
+    clamp_fn,
     invlerp,
+    invlerp_fn,
+    invlerp_many,
     lerp,
+    lerp_fn,
+    lerp_many,
+    make_remapper,
+    rand_intervals,
     rand_uniform,
     remap,
+    remap_many,
 )
 
 __all__: tuple[str, ...] = (
     "EMPTY_SET",
     "PI",
     "POSITIVE_REALS",
+    "NEGATIVE_REALS",
+    "NEGATIVE_UNIT",
+    "REALS",
     "NATURALS",
     "UNIT",
     "UNIT_DISK",
     "WHOLE_NUMBERS",
     "Bounds",
     "Interval",
+    "IntervalArray",
+    "IntervalIndex",
     "IntervalType",
     "Number",
     "IntervalError",
     "IntervalTypeError",
     "IntervalValueError",
     "clamp",
+    "clamp_fn",
     "invlerp",
+    "invlerp_fn",
+    "invlerp_many",
     "lerp",
+    "lerp_fn",
+    "lerp_many",
+    "make_remapper",
+    "rand_intervals",
     "rand_uniform",
     "remap",
+    "remap_many",
 )
@@ -4,18 +4,24 @@
 
 from __future__ import annotations
 
+import bisect
 import fractions
+import heapq
+import itertools
 import math
 import operator as op
 import random
+import struct
+import sys
 import warnings
 
+from array import array
 from enum import Enum
-from functools import reduce
+from functools import lru_cache, reduce
 from typing import TYPE_CHECKING, Any, Literal, Sequence, Union, get_args
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator
+    from collections.abc import Callable, Iterable, Iterator
 
 ########################################################################################
 #                                       CONSTANTS                                      #
@@ -26,7 +32,15 @@ Number = Union[int, float, fractions.Fraction]
 """A type alias for the `float | int | Fraction` union."""
 
 EPSILON: float = 1e-15
+"""
+Deprecated, and no longer used: open bounds are adjusted to the next float instead.
+"""
+
 _INF: float = float("inf")
+_NINF: float = -_INF
+
+# Checked in order, so that no separator is found inside another
+_PLUS_MINUS_SEPARATORS = ("±", "+/-", "+-", "p/m", "pm")
 
 
 class IntervalError(Exception):
@@ -82,7 +96,137 @@ class IntervalType(Enum):
 ########################################################################################
 
 
+def _nextafter_py38(x: float, y: float) -> float:
+    """
+    `math.nextafter` for Python 3.8, which doesn't have it: the next float after x in
+    the direction of y.
+    """
+    if x != x or y != y:
+        return x + y
+    if x == y:
+        return y
+    if x == 0:
+        return math.copysign(5e-324, y)
+    bits = struct.unpack("<q", struct.pack("<d", x))[0]
+    bits += 1 if (y > x) == (x > 0) else -1
+    return struct.unpack("<d", struct.pack("<q", bits))[0]
+
+
+_nextafter = math.nextafter if sys.version_info >= (3, 9) else _nextafter_py38
+
+
+def _adjusted_bounds(
+    lower_bound: Number,
+    upper_bound: Number,
+    lower_closure: IntervalType,
+    upper_closure: IntervalType,
+) -> tuple[Number, Number]:
+    """
+    The actual values of the bounds, with each open bound moved to the next float
+    inwards, shared by `Bounds` and `Interval`. Unlike adding a fixed epsilon, this is
+    the smallest possible adjustment at every magnitude. Infinite bounds stay infinite.
+    """
+    return (
+        _nextafter(float(lower_bound), _INF)
+        if lower_closure is IntervalType.OPEN and lower_bound != _NINF
+        else lower_bound,
+        _nextafter(float(upper_bound), _NINF)
+        if upper_closure is IntervalType.OPEN and upper_bound != _INF
+        else upper_bound,
+    )
+
+
+@lru_cache(maxsize=256)
+def _parse_interval_string(
+    interval_string: str, *, plus_minus_only: bool = False
+) -> tuple[Number, Number, IntervalType, IntervalType]:
+    """
+    The bounds and closures written in an interval string, for `Interval.from_string`,
+    or with `plus_minus_only`, for `Interval.from_plus_minus_many`, which doesn't
+    accept bracket notation. Cached, since the same few strings tend to be parsed over
+    and over.
+    """
+    original = interval_string
+    interval_string = interval_string.lower().strip().replace(" ", "")
+
+    first, last = interval_string[:1], interval_string[-1:]
+
+    # Normal form
+    if not plus_minus_only and first in ("[", "(") and last in (")", "]"):
+        body = interval_string[1:-1]
+        # the bounds are separated by ",", ".." or "..."
+        separator_start = body.find(",")
+        if separator_start != -1:
+            separator_end = separator_start + 1
+        else:
+            separator_start = body.find("..")
+            separator_end = separator_start + (
+                3 if body.startswith("...", separator_start) else 2
+            )
+        if separator_start != -1:
+            lower_bound, upper_bound = body[:separator_start], body[separator_end:]
+            try:
+                # an empty bound is infinite
+                return (
+                    float(lower_bound) if lower_bound else _NINF,
+                    float(upper_bound) if upper_bound else _INF,
+                    IntervalType.OPEN if first == "(" else IntervalType.CLOSED,
+                    IntervalType.OPEN if last == ")" else IntervalType.CLOSED,
+                )
+            except ValueError:
+                # each bound must be either a float ... or an empty string
+                raise IntervalValueError(
+                    "each bound",
+                    "either a float as a string, or an empty string",
+                    f"input was '{original}'",
+                ) from None
+
+    # Plus/Minus form
+    for separator in _PLUS_MINUS_SEPARATORS:
+        separator_start = interval_string.find(separator)
+        if separator_start != -1:
+            try:
+                center = float(interval_string[:separator_start])
+                plusminus = float(interval_string[separator_start + len(separator) :])
+            except ValueError:
+                # interval string must be in plus minus form ... (input was ...)
+                raise IntervalValueError(
+                    "interval string",
+                    "in plus minus form, with a float on each side of the separator",
+                    f"input was '{original}'",
+                ) from None
+            return (
+                center - plusminus,
+                center + plusminus,
+                IntervalType.CLOSED,
+                IntervalType.OPEN,
+            )
+
+    # interval string must be in plus minus form ... (input was ...)
+    if plus_minus_only:
+        raise IntervalValueError(
+            "interval string",
+            "in plus minus form, with a float on each side of the separator",
+            f"input was '{original}'",
+        )
+    # interval string must be a valid interval, matching ...(input was ...)
+    raise IntervalValueError(
+        "interval string",
+        "a valid interval, matching either the plus minus form or bracket notation",
+        f"input was '{original}'",
+    )
+
+
 class Bounds:
+    __slots__ = (
+        "lower_bound",
+        "upper_bound",
+        "lower_closure",
+        "upper_closure",
+        "adjusted_lower_bound",
+        "adjusted_upper_bound",
+    )
+
     def __init__(
         self,
         /,
@@ -109,14 +253,9 @@ class Bounds:
                 self.lower_closure,
             )
 
-        # The actual values of the bounds adjusted by a tiny number
-        # TODO: this number's magnitude should depend somehow on the magnitude of the
-        # interval's bounds
-        self.adjusted_lower_bound: Number = self.lower_bound + EPSILON * (
-            self.lower_closure == IntervalType.OPEN
-        )
-        self.adjusted_upper_bound: Number = self.upper_bound - EPSILON * (
-            self.upper_closure == IntervalType.OPEN
+        # The actual values of the bounds, with open bounds moved one float inwards
+        self.adjusted_lower_bound, self.adjusted_upper_bound = _adjusted_bounds(
+            self.lower_bound, self.upper_bound, self.lower_closure, self.upper_closure
         )
 
 
@@ -156,6 +295,21 @@ class Interval:
     The arguments with type Number can be integers, floats, or fractions.
     """
 
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = (
+        "lower_bound",
+        "upper_bound",
+        "lower_closure",
+        "upper_closure",
+        "adjusted_lower_bound",
+        "adjusted_upper_bound",
+        "datatypes",
+        "width",
+        "midpoint",
+        "is_empty",
+        "_hash",
+    )
+
     ####################################### INIT #######################################
 
     def __init__(
@@ -176,85 +330,126 @@ class Interval:
             lower_closure=lower_closure,
             upper_closure=upper_closure,
         )
+        self._set_bounds(
+            bounds.lower_bound,
+            bounds.upper_bound,
+            bounds.lower_closure,
+            bounds.upper_closure,
+        )
+
+    @classmethod
+    def _unchecked(
+        cls,
+        lower_bound: Number,
+        upper_bound: Number,
+        lower_closure: IntervalType,
+        upper_closure: IntervalType,
+    ) -> Interval:
+        """
+        A private classmethod. Builds an interval from bounds that are already in order,
+        skipping the round trip through `Bounds`. Used by operations that provably
+        preserve the order of the bounds.
+        """
+        interval = cls.__new__(cls)
+        interval._set_bounds(  # noqa: SLF001 (a new instance of cls)
+            lower_bound, upper_bound, lower_closure, upper_closure
+        )
+        return interval
 
+    def _set_bounds(
+        self,
+        lower_bound: Number,
+        upper_bound: Number,
+        lower_closure: IntervalType,
+        upper_closure: IntervalType,
+    ) -> None:
+        """
+        A private method. Sets every attribute from bounds that are already in order.
+        """
         # The user-facing values of the bounds
-        self.lower_bound = bounds.lower_bound
-        self.upper_bound = bounds.upper_bound
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
 
         # Lower and upper bound interval type (unbounded sides must be closed)
         # Interval type here is either closed or open
-        self.lower_closure = bounds.lower_closure
-        self.upper_closure = bounds.upper_closure
+        self.lower_closure = lower_closure
+        self.upper_closure = upper_closure
 
-        self.adjusted_lower_bound = bounds.adjusted_lower_bound
-        self.adjusted_upper_bound = bounds.adjusted_upper_bound
+        self.adjusted_lower_bound, self.adjusted_upper_bound = _adjusted_bounds(
+            lower_bound, upper_bound, lower_closure, upper_closure
+        )
 
         self.datatypes = (type(self.lower_bound), type(self.upper_bound))
 
+        # Precomputed, since intervals don't change after construction
+        # The positive difference between the apparent lower and upper bounds
+        self.width: Number = self.upper_bound - self.lower_bound
+        # The arithmetic average of the two bounds, treating each as closed
+        self.midpoint: Number = (self.lower_bound + self.upper_bound) / 2
+        # Only the empty set has zero width and two open bounds
+        self.is_empty: bool = (
+            self.width == 0
+            and self.lower_closure is self.upper_closure is IntervalType.OPEN
+        )
+        # Computed by __hash__ on first use, and reset here whenever the bounds are set
+        self._hash: int | None = None
+
     @classmethod
     def from_string(cls, interval_string: str, /) -> Interval:
-        original = interval_string
-        interval_string = interval_string.lower().strip().replace(" ", "")
+        """
+        ### Description
+        Parses an interval in bracket notation, such as `"[0, 5)"`, or in plus-minus
+        form, such as `"3 +- 2"`.
 
-        # Normal form
-        if (
-            interval_string.startswith(("[", "("))
-            and interval_string.endswith((")", "]"))
-            and ("," in interval_string or ".." in interval_string)
-        ):
-            lower_closure = (
-                IntervalType.OPEN
-                if interval_string.startswith("(")
-                else IntervalType.CLOSED
-            )
-            upper_closure = (
-                IntervalType.OPEN
-                if interval_string.endswith(")")
-                else IntervalType.CLOSED
-            )
-            # convert to canonical form
-            interval_string = (
-                interval_string.strip("[()]").replace("...", ",").replace("..", ",")
-            )
-            (lower_bound, upper_bound) = interval_string.split(",")
+        Parsing is cached, so the same string is only read once, but each call returns
+        a new interval.
+        """
+        lower_bound, upper_bound, lower_closure, upper_closure = _parse_interval_string(
+            interval_string
+        )
+        return cls(
+            lower_bound,
+            upper_bound,
+            lower_closure=lower_closure,
+            upper_closure=upper_closure,
+        )
 
-            try:
-                return cls(
-                    # default value triggers if string is empty
-                    float(lower_bound or -_INF),
-                    float(upper_bound or +_INF),
+    @classmethod
+    def from_strings(cls, interval_strings: Iterable[str], /) -> list[Interval]:
+        """
+        ### Description
+        Parses many strings in either form `Interval.from_string` accepts, with the same
+        cached parser, such as when reading a column of intervals from a file.
+        """
+        return [
+            cls.from_string(interval_string) for interval_string in interval_strings
+        ]
+
+    @classmethod
+    def from_plus_minus_many(cls, interval_strings: Iterable[str], /) -> list[Interval]:
+        """
+        ### Description
+        Parses many strings in plus-minus form, such as `"3 +- 2"` or `"1.79 ± 0.005"`,
+        with the same cached parser as `Interval.from_string`. Bracket notation is not
+        accepted.
+        """
+        intervals: list[Interval] = []
+        for interval_string in interval_strings:
+            (
+                lower_bound,
+                upper_bound,
+                lower_closure,
+                upper_closure,
+            ) = _parse_interval_string(interval_string, plus_minus_only=True)
+            intervals.append(
+                cls(
+                    lower_bound,
+                    upper_bound,
                     lower_closure=lower_closure,
                     upper_closure=upper_closure,
                 )
-            except ValueError:
-                # each bound must be either a float ... or an empty string
-                raise IntervalValueError(
-                    "each bound",
-                    "either a float as a string, or an empty string",
-                    f"input was '{original}'",
-                ) from None
-
-        # Plus/Minus form
-        if any(
-            separator in interval_string
-            for separator in ("pm", "p/m", "+-", "+/-", "±")
-        ):
-            interval_string = (
-                interval_string.replace("±", "pm")
-                .replace("+-", "pm")
-                .replace("+/-", "pm")
-                .replace("p/m", "pm")
             )
-            center, plusminus = map(float, interval_string.split("pm"))
-            return Interval(center - plusminus, center + plusminus)
-
-        # interval string must be a valid interval, matching ...(input was ...)
-        raise IntervalValueError(
-            "interval string",
-            "a valid interval, matching either the plus minus form or bracket "
-            "notation",
-            f"input was '{original}'",
-        )
+        return intervals
 
     @classmethod
     def p_adic(
@@ -332,40 +527,24 @@ class Interval:
 
     @property
     def is_bounded(self) -> bool:
-        return _INF not in (abs(self.lower_bound), abs(self.upper_bound))
+        return not (math.isinf(self.lower_bound) or math.isinf(self.upper_bound))
 
     @property
     def lower_bound_is_finite(self) -> bool:
-        return self.lower_bound != -_INF
+        return self.lower_bound != _NINF
 
     @property
     def upper_bound_is_finite(self) -> bool:
-        return self.upper_bound != +_INF
-
-    @property
-    def width(self) -> Number:
-        """
-        ### Description
-        The positive difference between the apparent lower and upper bounds.
-        """
-        return self.upper_bound - self.lower_bound
+        return self.upper_bound != _INF
 
     @property
     def interval_type(self) -> IntervalType:
-        if self.lower_closure == self.upper_closure == IntervalType.CLOSED:
+        if self.lower_closure is self.upper_closure is IntervalType.CLOSED:
             return IntervalType.CLOSED
-        if self.lower_closure == self.upper_closure == IntervalType.OPEN:
+        if self.lower_closure is self.upper_closure is IntervalType.OPEN:
             return IntervalType.OPEN
         return IntervalType.HALF_OPEN
 
-    @property
-    def midpoint(self) -> Number:
-        """
-        ### Description
-        Returns the arithmetic average of the two bounds, treating each as closed.
-        """
-        return (self.lower_bound + self.upper_bound) / 2
-
     ################################## NORMAL METHODS ##################################
 
     def as_plus_minus(self, *, precision: int = 3) -> str:
@@ -395,48 +574,44 @@ class Interval:
         the upper bound is also infinite, a ValueError is raised.
         """
 
-        original_start: Number | None = start
-        if step == 0:
-            # step must be nonzero
-            raise IntervalValueError("step", "nonzero", f"was {step}")
-        if abs(step) == _INF:
-            # step must be finite
-            raise IntervalValueError("step", "finite", f"was {step}")
-
-        if not (self.lower_bound_is_finite or start is not None):
-            start = self.upper_bound
-
-        if not (self.lower_bound_is_finite or self.upper_bound_is_finite):
-            # at least one bound must be finite
-            raise IntervalValueError(
-                "at least one bound", "finite", f"interval was {self}"
-            )
+        start = self._step_start(step, start)
+        # membership test inlined on local bounds, instead of `current in self`
+        lower, upper = self.adjusted_lower_bound, self.adjusted_upper_bound
+        count = self._step_count(start, step, upper if step > 0 else lower)
+        yield start
+        if count is not None:
+            for counter in range(1, count):
+                yield start + counter * step
+            return
+
+        # unbounded in the direction of the step
+        for counter in itertools.count(1):
+            current: Number = start + counter * step
+            if not lower <= current <= upper:
+                return
+            yield current
 
-        if not (self.lower_bound_is_finite or step <= 0):
-            # step must be negative if the lower bound is infinite
+    def step_array(
+        self, step: Number, /, *, start: Number | None = None
+    ) -> array[float]:
+        """
+        ### Description
+        Like `step`, but returns all the values at once in an `array("d")` buffer. The
+        number of values is computed up front, so the interval must be bounded in the
+        direction of the step, and the step can't be too small for floats to resolve
+        near the bounds.
+        """
+        start = self._step_start(step, start)
+        limit = self.adjusted_upper_bound if step > 0 else self.adjusted_lower_bound
+        count = self._step_count(start, step, limit)
+        if count is None:
+            # interval must be bounded ... with a step floats can resolve
             raise IntervalValueError(
-                "step", "negative if the lower bound is infinite", f"was {step}"
+                "interval",
+                "bounded in the direction of the step, with a step floats can resolve",
+                f"interval was {self}, step was {step}",
             )
-
-        if start is None:
-            start = self.lower_bound
-
-        if start not in self:
-            start += step
-            if start not in self:
-                # start must be one or fewer steps away from interval
-                raise IntervalValueError(
-                    "start",
-                    "one or fewer steps away from interval",
-                    f"interval was {self}, step was {step},"
-                    f"and start was {original_start}",
-                )
-        counter = 1
-        current: Number = start
-        while current in self:
-            yield current
-            current = start + counter * step
-            counter += 1
+        return array("d", [start + counter * step for counter in range(count)])
 
     def steps(self, subdivisions: Number) -> Iterator[Number]:
         """
@@ -456,7 +631,20 @@ class Interval:
             raise IntervalValueError(
                 "number of subdivisions", "1 or greater", f"was {subdivisions}"
             )
+        lower_bound, upper_bound = self.lower_bound, self.upper_bound
         subdivision_width = self.width / subdivisions
+        count = (
+            self._step_count(lower_bound, subdivision_width, upper_bound)
+            if subdivision_width > 0
+            else None
+        )
+        if count is not None:
+            yield lower_bound
+            for counter in range(1, count):
+                yield lower_bound + counter * subdivision_width
+            return
+
+        # degenerate interval, or too many subdivisions to count up front
         counter = 1
         subdivision = self.lower_bound
         while subdivision <= self.upper_bound:
@@ -525,8 +713,182 @@ class Interval:
             upper_closure=IntervalType.OPEN,
         )
 
+    # ---------------------------------- REDUCTIONS ---------------------------------- #
+
+    @staticmethod
+    def union_many(intervals: Iterable[Interval]) -> list[Interval]:
+        """
+        ### Description
+        Returns the union of any number of intervals as a sorted list of disjoint
+        intervals, fusing those that intersect, or that touch where at least one of the
+        two touching bounds is closed. `(0, 1)` and `(1, 2)` stay apart, since neither
+        contains 1.
+
+        Intervals that contain no points, such as `[0, 0)`, are left out. The rest are
+        sorted by lower bound once and then swept in a single pass, instead of being
+        unioned pairwise.
+        """
+        ordered = sorted(
+            (
+                interval
+                for interval in intervals
+                if interval.adjusted_lower_bound <= interval.adjusted_upper_bound
+            ),
+            key=lambda interval: (
+                interval.lower_bound,
+                interval.lower_closure is not IntervalType.CLOSED,
+            ),
+        )
+        if not ordered:
+            return []
+
+        fused: list[Interval] = []
+        current = ordered[0]
+        for interval in ordered[1:]:
+            if interval.lower_bound > current.upper_bound or (
+                interval.lower_bound == current.upper_bound
+                and current.upper_closure is IntervalType.OPEN
+                and interval.lower_closure is IntervalType.OPEN
+            ):
+                fused.append(current)
+                current = interval
+            elif interval.upper_bound > current.upper_bound or (
+                interval.upper_bound == current.upper_bound
+                and interval.upper_closure is IntervalType.CLOSED
+            ):
+                current = current.where(
+                    upper_bound=interval.upper_bound,
+                    upper_closure=interval.upper_closure,
+                )
+        fused.append(current)
+        return fused
+
+    @staticmethod
+    def intersect_many(intervals: Iterable[Interval]) -> Interval:
+        """
+        ### Description
+        Returns the intersection of any number of intervals in a single pass, keeping
+        the greatest lower bound and the least upper bound. Where bounds tie, the open
+        one wins.
+
+        Returns `REALS`, the closed interval [-inf, +inf], if no intervals are given.
+        """
+        lower_bound: Number = _NINF
+        upper_bound: Number = _INF
+        lower_closure = upper_closure = IntervalType.CLOSED
+        empty_input = True
+        for interval in intervals:
+            empty_input = False
+            if interval.lower_bound > lower_bound or (
+                interval.lower_bound == lower_bound
+                and interval.lower_closure is IntervalType.OPEN
+            ):
+                lower_bound, lower_closure = (
+                    interval.lower_bound,
+                    interval.lower_closure,
+                )
+            if interval.upper_bound < upper_bound or (
+                interval.upper_bound == upper_bound
+                and interval.upper_closure is IntervalType.OPEN
+            ):
+                upper_bound, upper_closure = (
+                    interval.upper_bound,
+                    interval.upper_closure,
+                )
+
+        if empty_input:
+            return REALS
+        if lower_bound > upper_bound or (
+            lower_bound == upper_bound
+            and IntervalType.OPEN in (lower_closure, upper_closure)
+        ):
+            return EMPTY_SET
+        return Interval(
+            lower_bound,
+            upper_bound,
+            lower_closure=lower_closure,
+            upper_closure=upper_closure,
+        )
+
     # -------------------------------- HELPER METHODS -------------------------------- #
 
+    def _step_start(self, step: Number, start: Number | None) -> Number:
+        """
+        A private method. Validates the arguments of `step` and returns the value to
+        start stepping from.
+        """
+        original_start: Number | None = start
+        if step == 0:
+            # step must be nonzero
+            raise IntervalValueError("step", "nonzero", f"was {step}")
+        if math.isinf(step):
+            # step must be finite
+            raise IntervalValueError("step", "finite", f"was {step}")
+
+        if not (self.lower_bound_is_finite or start is not None):
+            start = self.upper_bound
+
+        if not (self.lower_bound_is_finite or self.upper_bound_is_finite):
+            # at least one bound must be finite
+            raise IntervalValueError(
+                "at least one bound", "finite", f"interval was {self}"
+            )
+
+        if not (self.lower_bound_is_finite or step <= 0):
+            # step must be negative if the lower bound is infinite
+            raise IntervalValueError(
+                "step", "negative if the lower bound is infinite", f"was {step}"
+            )
+
+        if start is None:
+            start = self.lower_bound
+
+        # membership tests inlined on local bounds, instead of `start in self`
+        lower, upper = self.adjusted_lower_bound, self.adjusted_upper_bound
+        if not lower <= start <= upper:
+            start += step
+            if not lower <= start <= upper:
+                # start must be one or fewer steps away from interval
+                raise IntervalValueError(
+                    "start",
+                    "one or fewer steps away from interval",
+                    f"interval was {self}, step was {step},"
+                    f"and start was {original_start}",
+                )
+        return start
+
+    @staticmethod
+    def _step_count(start: Number, step: Number, limit: Number) -> int | None:
+        """
+        A private staticmethod. Returns how many of the values `start + i * step`, for
+        `i = 0, 1, 2, ...`, do not pass `limit`, or `None` if `limit` is infinite or the
+        distance to it overflows.
+
+        Also `None` if the step is too small for floats to resolve near `start` or
+        `limit`, where the values stop matching the distance divided by the step.
+        Callers fall back to comparing the values one at a time.
+        """
+        quotient = (limit - start) / step
+        if math.isinf(quotient):
+            return None
+        # Beyond this, the corrections below would take one iteration per float
+        if abs(float(step)) * 2**52 <= max(abs(float(start)), abs(float(limit))):
+            return None
+        count = math.floor(quotient) + 1
+        # correct for rounding error in the division so that the count matches an
+        # element-by-element comparison against `limit`
+        if step > 0:
+            while count > 0 and start + (count - 1) * step > limit:
+                count -= 1
+            while start + count * step <= limit:
+                count += 1
+        else:
+            while count > 0 and start + (count - 1) * step < limit:
+                count -= 1
+            while start + count * step >= limit:
+                count += 1
+        return count
+
     @staticmethod
     def _x_div_0_is_inf(
         x: Number, y: Number, fn: Callable[[Number, Number], Number]
@@ -545,7 +907,7 @@ class Interval:
     def __bool__(self) -> bool:
         # Only empty sets will return False
         # Degenerate intervals return True
-        return not (self.interval_type == IntervalType.OPEN and self.width == 0)
+        return not self.is_empty
 
     def __len__(self) -> int:
         return math.floor(self.adjusted_upper_bound) - math.floor(
@@ -554,7 +916,7 @@ class Interval:
 
     def __iter__(self) -> Iterator[Number]:
         sign = +1
-        if self.lower_bound == -_INF:
+        if self.lower_bound == _NINF:
             if self.upper_bound == _INF:
                 raise IntervalValueError(
                     "interval to iterate in",
@@ -568,20 +930,29 @@ class Interval:
         if not isinstance(other, Interval):
             return NotImplemented
         return (
-            self.lower_bound,
-            self.upper_bound,
-            self.lower_closure,
-            self.upper_closure,
-        ) == (
-            other.lower_bound,
-            other.upper_bound,
-            other.lower_closure,
-            other.upper_closure,
+            self.lower_bound == other.lower_bound
+            and self.upper_bound == other.upper_bound
+            and self.lower_closure == other.lower_closure
+            and self.upper_closure == other.upper_closure
         )
 
     def __ne__(self, other: object) -> bool:
         return not self == other
 
+    def __hash__(self) -> int:
+        # Consistent with __eq__, so intervals can be used as set members & dict keys
+        # Computed on first use and kept until the bounds are set again
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    self.lower_bound,
+                    self.upper_bound,
+                    self.lower_closure,
+                    self.upper_closure,
+                )
+            )
+        return self._hash
+
     # ---------------------------------- COMPARISON ---------------------------------- #
 
     # NOTE that between two Intervals, >= and > are the same, and <= and < are the same.
@@ -688,9 +1059,11 @@ class Interval:
         return self > other
 
     def __invert__(self) -> Interval:
-        return self.where(
-            lower_closure=~self.lower_closure,
-            upper_closure=~self.upper_closure,
+        return self._unchecked(
+            self.lower_bound,
+            self.upper_bound,
+            ~self.lower_closure,
+            ~self.upper_closure,
         )
 
     def __neg__(self) -> Interval:
@@ -709,15 +1082,17 @@ class Interval:
     def _binary_fn(
         x: Interval, y: Interval, fn: Callable[[Number, Number], Number]
     ) -> Interval:
-        possible_bounds: list[Number] = [
+        possible_bounds: tuple[Number, ...] = (
             fn(x.lower_bound, y.lower_bound),
             fn(x.lower_bound, y.upper_bound),
             fn(x.upper_bound, y.lower_bound),
             fn(x.upper_bound, y.upper_bound),
-        ]
-        return Interval(
+        )
+        return Interval._unchecked(  # noqa: SLF001 (staticmethod, no cls)
             min(possible_bounds),
             max(possible_bounds),
+            IntervalType.CLOSED,
+            IntervalType.OPEN,
         )
 
     @staticmethod
@@ -730,9 +1105,13 @@ class Interval:
 
     def __add__(self, other: Number | Interval) -> Interval:
         if isinstance(other, (float, int)):
-            return self.where(
-                lower_bound=self.lower_bound + other,
-                upper_bound=self.upper_bound + other,
+            if other == 0:
+                return self
+            return Interval._unchecked(
+                self.lower_bound + other,
+                self.upper_bound + other,
+                self.lower_closure,
+                self.upper_closure,
             )
 
         if isinstance(other, Interval):
@@ -744,9 +1123,13 @@ class Interval:
 
     def __sub__(self, other: Number | Interval) -> Interval:
         if isinstance(other, (float, int)):
-            return self.where(
-                lower_bound=self.lower_bound - other,
-                upper_bound=self.upper_bound - other,
+            if other == 0:
+                return self
+            return Interval._unchecked(
+                self.lower_bound - other,
+                self.upper_bound - other,
+                self.lower_closure,
+                self.upper_closure,
             )
 
         if isinstance(other, Interval):
@@ -758,6 +1141,15 @@ class Interval:
 
     def __mul__(self, other: Number | Interval) -> Interval:
         if isinstance(other, (float, int)):
+            if other == 1:
+                return self
+            if other > 0:
+                return Interval._unchecked(
+                    self.lower_bound * other,
+                    self.upper_bound * other,
+                    self.lower_closure,
+                    self.upper_closure,
+                )
             return self.where(
                 lower_bound=self.lower_bound * other,
                 upper_bound=self.upper_bound * other,
@@ -772,6 +1164,15 @@ class Interval:
 
     def __truediv__(self, other: Number | Interval) -> Interval:
         if isinstance(other, (float, int)):
+            if other == 1:
+                return self
+            if other > 0:
+                return Interval._unchecked(
+                    self.lower_bound / other,
+                    self.upper_bound / other,
+                    self.lower_closure,
+                    self.upper_closure,
+                )
             return self.where(
                 lower_bound=self.lower_bound / other,
                 upper_bound=self.upper_bound / other,
@@ -790,6 +1191,13 @@ class Interval:
 
     def __floordiv__(self, other: Number | Interval) -> Interval:
         if isinstance(other, (float, int)):
+            if other > 0:
+                return Interval._unchecked(
+                    self.lower_bound // other,
+                    self.upper_bound // other,
+                    self.lower_closure,
+                    self.upper_closure,
+                )
             return self.where(
                 lower_bound=self.lower_bound // other,
                 upper_bound=self.upper_bound // other,
@@ -807,6 +1215,8 @@ class Interval:
         )
 
     def __pow__(self, exponent: Number) -> Interval:
+        if exponent == 1:
+            return self
         if not (
             isinstance(exponent, int)
             or (self.lower_bound >= 0 and self.upper_bound >= 0)
@@ -831,11 +1241,19 @@ class Interval:
         return value % self.width + self.lower_bound
 
     def __and__(self, other: Interval) -> Interval:
-        if not self.intersects(other):
+        # `self.intersects(other)`, inlined
+        if not (
+            other.adjusted_lower_bound <= self.adjusted_upper_bound
+            and self.adjusted_lower_bound <= other.adjusted_upper_bound
+        ):
             return EMPTY_SET
-        return Interval(
-            max(self.lower_bound, other.lower_bound),
-            min(self.upper_bound, other.upper_bound),
+        lo1, lo2 = self.lower_bound, other.lower_bound
+        hi1, hi2 = self.upper_bound, other.upper_bound
+        return Interval._unchecked(
+            lo1 if lo1 > lo2 else lo2,
+            hi1 if hi1 < hi2 else hi2,
+            IntervalType.CLOSED,
+            IntervalType.OPEN,
         )
 
     # union
@@ -849,17 +1267,15 @@ class Interval:
                 raise IntervalValueError(
                     "intervals must intersect or be adjacent to create a union"
                 )
-            return Interval(
-                min(self.lower_bound, other.lower_bound),
-                max(self.upper_bound, other.upper_bound),
-                # lower closure of the interval with the lower lower bound, and
-                # upper closure of the interval with the higher upper bound
-                lower_closure=(
-                    self if self.lower_bound < other.lower_bound else other
-                ).lower_closure,
-                upper_closure=(
-                    self if self.upper_bound > other.upper_bound else other
-                ).upper_closure,
+            # lower bound & closure of the interval with the lower lower bound, and
+            # upper bound & closure of the interval with the higher upper bound
+            lower = self if self.lower_bound < other.lower_bound else other
+            upper = self if self.upper_bound > other.upper_bound else other
+            return Interval._unchecked(
+                lower.lower_bound,
+                upper.upper_bound,
+                lower.lower_closure,
+                upper.upper_closure,
             )
 
         # if other is a Number, and also within the interval, just return the number
@@ -892,15 +1308,59 @@ class Interval:
         Rounds x down (floor) or up (ceil) if direction is +1 or -1 respectively. Errors
         if direction has any other value. Also takes ndigits: the precision to round to.
         """
-        if float(x).is_integer():
-            return x
         if abs(direction) != 1:
             raise IntervalValueError(
                 "direction", "up (+1) or down (-1)", f"was {direction}"
             )
-        out = round(x + direction * (0.5 * 10**-ndigits), ndigits)
+        return Interval._round_by(  # noqa: SLF001 (staticmethod, no cls)
+            x, ndigits, direction * (0.5 * 10**-ndigits)
+        )
+
+    @staticmethod
+    def _round_by(x: Number, ndigits: int, offset: float) -> Number:
+        """
+        A private staticmethod. Like `_round`, but takes the half-unit offset
+        `±0.5 * 10**-ndigits` precomputed, so that rounding both bounds of an interval
+        only raises 10 to a power once.
+        """
+        if float(x).is_integer():
+            return x
+        out = round(x + offset, ndigits)
         return float(out) if ndigits > 0 else int(out)
 
+    @staticmethod
+    def _round_scaled(x: Number, scale: int, direction: Literal[-1, 1]) -> Number:
+        """
+        A private staticmethod. Rounds x down (-1) or up (+1) to a multiple of
+        `1 / scale`, with one multiplication and `math.floor` or `math.ceil` instead of
+        `round`. The result is nudged by one unit if the multiplication or division
+        lost precision, so it never lands on the wrong side of x.
+        """
+        # Whole numbers are already multiples, and every large float is whole
+        if math.isinf(x) or float(x).is_integer():
+            return x
+        try:
+            scaled = x * scale
+        except OverflowError:
+            # scale is too large to be a float: finer than any float can resolve
+            return x
+        # Already a multiple as far as floats can tell, or too large to scale
+        if math.isinf(scaled) or float(scaled).is_integer():
+            return x
+        if direction < 0:
+            out = math.floor(scaled)
+            if out / scale > x:
+                out -= 1
+            elif (out + 1) / scale <= x:
+                out += 1
+        else:
+            out = math.ceil(scaled)
+            if out / scale < x:
+                out += 1
+            elif (out - 1) / scale >= x:
+                out -= 1
+        return out / scale
+
     def __round__(self, ndigits: int | None = None) -> Interval:
         """
         ### Description
@@ -917,32 +1377,63 @@ class Interval:
                 upper_bound=math.ceil(self.upper_bound),
             )
 
+        # Rounding outwards keeps the bounds in order, so there's nothing to check
+        if ndigits > 0:
+            scale = 10**ndigits
+            return self._unchecked(
+                self._round_scaled(self.lower_bound, scale, -1),
+                self._round_scaled(self.upper_bound, scale, +1),
+                self.lower_closure,
+                self.upper_closure,
+            )
+
+        half_unit = 0.5 * 10**-ndigits
         return self.where(
-            lower_bound=Interval._round(
-                self.lower_bound, ndigits=ndigits, direction=-1
-            ),
-            upper_bound=Interval._round(self.upper_bound, ndigits=ndigits, direction=1),
+            lower_bound=self._round_by(self.lower_bound, ndigits, -half_unit),
+            upper_bound=self._round_by(self.upper_bound, ndigits, +half_unit),
         )
 
     def __floor__(self, ndigits: int = 0) -> Interval:
+        # Flooring both bounds keeps them in order, so there's nothing to check
+        if ndigits > 0:
+            scale = 10**ndigits
+            return self._unchecked(
+                self._round_scaled(self.lower_bound, scale, -1),
+                self._round_scaled(self.upper_bound, scale, -1),
+                IntervalType.OPEN,
+                IntervalType.CLOSED,
+            )
+
+        half_unit = 0.5 * 10**-ndigits
         return Interval(
-            Interval._round(self.lower_bound, ndigits=ndigits, direction=-1),
-            Interval._round(self.upper_bound, ndigits=ndigits, direction=-1),
+            self._round_by(self.lower_bound, ndigits, -half_unit),
+            self._round_by(self.upper_bound, ndigits, -half_unit),
             lower_closure=IntervalType.OPEN,
             upper_closure=IntervalType.CLOSED,
         )
 
     def __ceil__(self, ndigits: int = 0) -> Interval:
+        # Ceiling both bounds keeps them in order, so there's nothing to check
+        if ndigits > 0:
+            scale = 10**ndigits
+            return self._unchecked(
+                self._round_scaled(self.lower_bound, scale, +1),
+                self._round_scaled(self.upper_bound, scale, +1),
+                IntervalType.OPEN,
+                IntervalType.CLOSED,
+            )
+
+        half_unit = 0.5 * 10**-ndigits
         return Interval(
-            Interval._round(self.lower_bound, ndigits=ndigits, direction=1),
-            Interval._round(self.upper_bound, ndigits=ndigits, direction=1),
+            self._round_by(self.lower_bound, ndigits, +half_unit),
+            self._round_by(self.upper_bound, ndigits, +half_unit),
             lower_closure=IntervalType.OPEN,
             upper_closure=IntervalType.CLOSED,
         )
 
     def __str__(self) -> str:
         # Empty set
-        if self.width == 0 and self.interval_type == IntervalType.OPEN:
+        if self.is_empty:
             return "{∅}"
 
         # Degenerate interval
@@ -951,19 +1442,15 @@ class Interval:
 
         # Normal
         lower, upper = self.lower_bound, self.upper_bound
-        l_bracket = "[" if self.lower_closure == IntervalType.CLOSED else "("
-        r_bracket = "]" if self.upper_closure == IntervalType.CLOSED else ")"
+        l_bracket = "[" if self.lower_closure is IntervalType.CLOSED else "("
+        r_bracket = "]" if self.upper_closure is IntervalType.CLOSED else ")"
         return f"{l_bracket}{lower}, {upper}{r_bracket}"
 
     def __repr__(self) -> str:
-        lo, hi = self.lower_bound, self.upper_bound
-        loc = self.lower_closure.name
-        hic = self.upper_closure.name
         return (
-            f"Interval("
-            f"lower_bound={lo}, upper_bound={hi}, "
-            f"lower_closure={loc}, upper_closure={hic}"
-            f")"
+            f"Interval(lower_bound={self.lower_bound}, upper_bound={self.upper_bound}, "
+            f"lower_closure={self.lower_closure.name}, "
+            f"upper_closure={self.upper_closure.name})"
         )
 
 
@@ -975,12 +1462,412 @@ class Interval:
 EMPTY_SET: Interval = Interval(0).opened()
 UNIT = Interval(1)
 UNIT_DISK = (-UNIT | UNIT).closed()
-POSITIVE_REALS = Interval(float("inf")).closed()
+POSITIVE_REALS = Interval(_INF).closed()
+NEGATIVE_UNIT = -UNIT
+NEGATIVE_REALS = -POSITIVE_REALS
+REALS = (NEGATIVE_REALS | POSITIVE_REALS).closed()
 NATURALS: Iterator[int] = (int(x) for x in (POSITIVE_REALS).step(1))
 WHOLE_NUMBERS: Iterator[int] = (int(x) for x in (POSITIVE_REALS + 1).step(1))
 PI = Interval.from_string(f"({223 / 71}, {22 / 7})")
 
 
+########################################################################################
+#                                    INTERVAL ARRAY                                    #
+########################################################################################
+
+
+class IntervalArray:
+    """
+    ### Description
+    A structure of arrays holding many intervals at once. Rather than one `Interval`
+    object per interval, the bounds live in contiguous `array("d")` buffers and the
+    closures in `array("b")` buffers (`1` for closed, `0` for open), so bulk queries
+    loop over plain floats instead of over objects.
+
+    Bounds are stored as floats. Each pair of bounds is put in the right order, as in
+    `Interval`.
+
+    ### Initialization
+    ```py
+    IntervalArray([0, 2], [1, 5])          # [0.0, 1.0), [2.0, 5.0)
+    IntervalArray.from_intervals([UNIT])  # [0.0, 1.0)
+    ```
+    """
+
+    __slots__ = (
+        "lower_bounds",
+        "upper_bounds",
+        "lower_closed",
+        "upper_closed",
+        "adjusted_lower_bounds",
+        "adjusted_upper_bounds",
+    )
+
+    def __init__(
+        self,
+        lower_bounds: Iterable[Number],
+        upper_bounds: Iterable[Number],
+        /,
+        lower_closed: Iterable[int] | None = None,
+        upper_closed: Iterable[int] | None = None,
+    ) -> None:
+        self.lower_bounds = array("d", map(float, lower_bounds))
+        self.upper_bounds = array("d", map(float, upper_bounds))
+        size = len(self.lower_bounds)
+        # closed lower bounds and open upper bounds by default, as in `Interval`
+        self.lower_closed = array(
+            "b", [1] * size if lower_closed is None else lower_closed
+        )
+        self.upper_closed = array(
+            "b", [0] * size if upper_closed is None else upper_closed
+        )
+        if not (
+            size
+            == len(self.upper_bounds)
+            == len(self.lower_closed)
+            == len(self.upper_closed)
+        ):
+            raise IntervalValueError(
+                "bounds and closures",
+                "all the same length",
+                f"lengths were {size}, {len(self.upper_bounds)}, "
+                f"{len(self.lower_closed)}, {len(self.upper_closed)}",
+            )
+
+        # Put start & end in the right order
+        for i in range(size):
+            if self.lower_bounds[i] > self.upper_bounds[i]:
+                self.lower_bounds[i], self.upper_bounds[i] = (
+                    self.upper_bounds[i],
+                    self.lower_bounds[i],
+                )
+                self.lower_closed[i], self.upper_closed[i] = (
+                    self.upper_closed[i],
+                    self.lower_closed[i],
+                )
+
+        # Same adjustment as `Bounds`, so membership agrees with `Interval`
+        self.adjusted_lower_bounds = array(
+            "d",
+            [
+                bound if closed or bound == _NINF else _nextafter(bound, _INF)
+                for bound, closed in zip(self.lower_bounds, self.lower_closed)
+            ],
+        )
+        self.adjusted_upper_bounds = array(
+            "d",
+            [
+                bound if closed or bound == _INF else _nextafter(bound, _NINF)
+                for bound, closed in zip(self.upper_bounds, self.upper_closed)
+            ],
+        )
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[Interval], /) -> IntervalArray:
+        intervals = list(intervals)
+        return cls(
+            [interval.lower_bound for interval in intervals],
+            [interval.upper_bound for interval in intervals],
+            [interval.lower_closure is IntervalType.CLOSED for interval in intervals],
+            [interval.upper_closure is IntervalType.CLOSED for interval in intervals],
+        )
+
+    def to_intervals(self) -> list[Interval]:
+        return list(self)
+
+    ################################## NORMAL METHODS ##################################
+
+    def contains(self, value: Number) -> list[bool]:
+        """
+        ### Description
+        Returns, for each interval, whether `value` is within it.
+        """
+        return [
+            lower <= value <= upper
+            for lower, upper in zip(
+                self.adjusted_lower_bounds, self.adjusted_upper_bounds
+            )
+        ]
+
+    def intersects(self, other: Interval) -> list[bool]:
+        """
+        ### Description
+        Returns, for each interval, whether there are any values present in both it and
+        `other`.
+        """
+        other_lower = other.adjusted_lower_bound
+        other_upper = other.adjusted_upper_bound
+        return [
+            other_lower <= upper and lower <= other_upper
+            for lower, upper in zip(
+                self.adjusted_lower_bounds, self.adjusted_upper_bounds
+            )
+        ]
+
+    def intersecting_indices(self, other: Interval) -> list[int]:
+        """
+        ### Description
+        Returns the positions of the intervals that intersect `other`, in one pass.
+        """
+        other_lower = other.adjusted_lower_bound
+        other_upper = other.adjusted_upper_bound
+        return [
+            i
+            for i, (lower, upper) in enumerate(
+                zip(self.adjusted_lower_bounds, self.adjusted_upper_bounds)
+            )
+            if other_lower <= upper and lower <= other_upper
+        ]
+
+    def overlapping_pairs(self, other: IntervalArray) -> tuple[list[int], list[int]]:
+        """
+        ### Description
+        Returns every pair of positions `(i, j)` where interval `i` of this array
+        intersects interval `j` of `other`, as two lists of the same length, ordered by
+        `i` then `j`.
+
+        Rather than testing all `len(self) * len(other)` pairs, this sweeps over both
+        arrays in order of lower bound, keeping the intervals seen so far in a heap by
+        upper bound and dropping them once the sweep has passed their end.
+        """
+        lowers = (self.adjusted_lower_bounds, other.adjusted_lower_bounds)
+        uppers = (self.adjusted_upper_bounds, other.adjusted_upper_bounds)
+        events = sorted(
+            [(lower, 0, i) for i, lower in enumerate(lowers[0])]
+            + [(lower, 1, j) for j, lower in enumerate(lowers[1])]
+        )
+        active: tuple[list[tuple[float, int]], list[tuple[float, int]]] = ([], [])
+        pairs: list[tuple[int, int]] = []
+        for lower, side, i in events:
+            upper: float = uppers[side][i]
+            # Everything still in the heap has started, and hasn't ended before `lower`
+            candidates = active[1 - side]
+            while candidates and candidates[0][0] < lower:
+                heapq.heappop(candidates)
+            candidate_lowers = lowers[1 - side]
+            for _, j in candidates:
+                if candidate_lowers[j] <= upper:
+                    pairs.append((i, j) if side == 0 else (j, i))
+            heapq.heappush(active[side], (upper, i))
+
+        pairs.sort()
+        return [i for i, _ in pairs], [j for _, j in pairs]
+
+    def clamp(self, values: Iterable[Number]) -> list[Number]:
+        """
+        ### Description
+        Clamps each value to within the interval at the same position.
+        """
+        clamped: list[Number] = []
+        for i, (value, lower, upper) in enumerate(
+            zip(values, self.lower_bounds, self.upper_bounds)
+        ):
+            if lower == upper and not (self.lower_closed[i] or self.upper_closed[i]):
+                raise IntervalValueError(
+                    "interval", "not the empty set", f"was {self[i]}"
+                )
+            clamped.append(
+                lower if value < lower else upper if value > upper else value
+            )
+        return clamped
+
+    # -------------------------------- HELPER METHODS -------------------------------- #
+
+    @staticmethod
+    def _binary_fn(
+        x: IntervalArray, y: IntervalArray, fn: Callable[[Number, Number], Number]
+    ) -> IntervalArray:
+        """
+        A private staticmethod. Applies `Interval._binary_fn` to each pair of intervals,
+        sweeping the bound buffers directly instead of building `Interval` objects.
+        """
+        if len(x) != len(y):
+            raise IntervalValueError(
+                "interval arrays", "the same length", f"were {len(x)} and {len(y)}"
+            )
+        lower_bounds: list[Number] = []
+        upper_bounds: list[Number] = []
+        for x_lower, x_upper, y_lower, y_upper in zip(
+            x.lower_bounds, x.upper_bounds, y.lower_bounds, y.upper_bounds
+        ):
+            possible_bounds = (
+                fn(x_lower, y_lower),
+                fn(x_lower, y_upper),
+                fn(x_upper, y_lower),
+                fn(x_upper, y_upper),
+            )
+            lower_bounds.append(min(possible_bounds))
+            upper_bounds.append(max(possible_bounds))
+        return IntervalArray(lower_bounds, upper_bounds)
+
+    @staticmethod
+    def _scalar_fn(
+        x: IntervalArray, y: Number, fn: Callable[[Number, Number], Number]
+    ) -> IntervalArray:
+        """
+        A private staticmethod. Applies `fn(bound, y)` to both bounds of every interval,
+        keeping the closures, as `Interval` does with a number. If `fn` flips a pair of
+        bounds, the constructor swaps them back along with their closures.
+        """
+        return IntervalArray(
+            [fn(lower, y) for lower in x.lower_bounds],
+            [fn(upper, y) for upper in x.upper_bounds],
+            x.lower_closed,
+            x.upper_closed,
+        )
+
+    ###################################### DUNDERS #####################################
+
+    def __len__(self) -> int:
+        return len(self.lower_bounds)
+
+    def __getitem__(self, index: int) -> Interval:
+        return Interval(
+            self.lower_bounds[index],
+            self.upper_bounds[index],
+            lower_closure=(
+                IntervalType.CLOSED if self.lower_closed[index] else IntervalType.OPEN
+            ),
+            upper_closure=(
+                IntervalType.CLOSED if self.upper_closed[index] else IntervalType.OPEN
+            ),
+        )
+
+    def __iter__(self) -> Iterator[Interval]:
+        return (self[i] for i in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalArray):
+            return NotImplemented
+        return (
+            self.lower_bounds == other.lower_bounds
+            and self.upper_bounds == other.upper_bounds
+            and self.lower_closed == other.lower_closed
+            and self.upper_closed == other.upper_closed
+        )
+
+    def __add__(self, other: IntervalArray | Number) -> IntervalArray:
+        if isinstance(other, (float, int)):
+            return IntervalArray._scalar_fn(self, other, op.add)
+        if not isinstance(other, IntervalArray):
+            return NotImplemented
+        return IntervalArray._binary_fn(self, other, op.add)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: IntervalArray | Number) -> IntervalArray:
+        if isinstance(other, (float, int)):
+            return IntervalArray._scalar_fn(self, other, op.sub)
+        if not isinstance(other, IntervalArray):
+            return NotImplemented
+        return IntervalArray._binary_fn(self, other, op.sub)
+
+    def __mul__(self, other: IntervalArray | Number) -> IntervalArray:
+        if isinstance(other, (float, int)):
+            return IntervalArray._scalar_fn(self, other, op.mul)
+        if not isinstance(other, IntervalArray):
+            return NotImplemented
+        return IntervalArray._binary_fn(self, other, op.mul)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: IntervalArray | Number) -> IntervalArray:
+        if isinstance(other, (float, int)):
+            return IntervalArray._scalar_fn(self, other, op.truediv)
+        if not isinstance(other, IntervalArray):
+            return NotImplemented
+        return IntervalArray._binary_fn(self, other, op.truediv)
+
+    def __repr__(self) -> str:
+        return f"IntervalArray({', '.join(str(interval) for interval in self)})"
+
+
+########################################################################################
+#                                    INTERVAL INDEX                                    #
+########################################################################################
+
+
+class IntervalIndex:
+    """
+    ### Description
+    A static index over many intervals, answering "which intervals overlap this?" in
+    `O((k + 1) log n)` time for `k` results, instead of testing all `n` intervals.
+
+    The intervals are sorted by lower bound once, and an implicit binary tree over that
+    order keeps the greatest upper bound in each subtree. A query only descends into the
+    sorted prefix that starts before it ends, and skips every subtree that ends before
+    it starts.
+
+    Results agree with `Interval.intersects` and `in`, and come back sorted by lower
+    bound.
+    """
+
+    __slots__ = ("_intervals", "_lower_bounds", "_max_upper_bounds", "_leaves")
+
+    def __init__(self, intervals: Iterable[Interval], /) -> None:
+        self._intervals = sorted(
+            intervals, key=lambda interval: interval.adjusted_lower_bound
+        )
+        self._lower_bounds = [
+            interval.adjusted_lower_bound for interval in self._intervals
+        ]
+
+        # Implicit tree: node `i` has children `2i` and `2i + 1`, and leaves start at
+        # index `self._leaves`
+        self._leaves = 1
+        while self._leaves < len(self._intervals):
+            self._leaves *= 2
+        self._max_upper_bounds: list[Number] = [_NINF] * (2 * self._leaves)
+        for i, interval in enumerate(self._intervals):
+            self._max_upper_bounds[self._leaves + i] = interval.adjusted_upper_bound
+        for node in range(self._leaves - 1, 0, -1):
+            left = self._max_upper_bounds[2 * node]
+            right = self._max_upper_bounds[2 * node + 1]
+            self._max_upper_bounds[node] = left if left > right else right
+
+    def overlapping(self, interval: Interval) -> list[Interval]:
+        """
+        ### Description
+        Returns every indexed interval that intersects `interval`.
+        """
+        return self._query(interval.adjusted_lower_bound, interval.adjusted_upper_bound)
+
+    def overlapping_point(self, value: Number) -> list[Interval]:
+        """
+        ### Description
+        Returns every indexed interval that contains `value`.
+        """
+        return self._query(value, value)
+
+    def _query(self, lower: Number, upper: Number) -> list[Interval]:
+        """
+        A private method. Returns the intervals whose adjusted bounds overlap the
+        closed range from `lower` to `upper`.
+        """
+        # only intervals starting at or before `upper` can overlap
+        stop = bisect.bisect_right(self._lower_bounds, upper)
+        found: list[Interval] = []
+        # (node, first leaf, one past last leaf), visiting left subtrees first
+        pending = [(1, 0, self._leaves)]
+        while pending:
+            node, first, last = pending.pop()
+            if first >= stop or self._max_upper_bounds[node] < lower:
+                continue
+            if last - first == 1:
+                found.append(self._intervals[first])
+                continue
+            middle = (first + last) // 2
+            pending.append((2 * node + 1, middle, last))
+            pending.append((2 * node, first, middle))
+        return found
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def __iter__(self) -> Iterator[Interval]:
+        return iter(self._intervals)
+
+
 ########################################################################################
 #                                   UTILITY FUNCTIONS                                  #
 ########################################################################################
@@ -1004,15 +1891,13 @@ def rand_uniform(interval: Interval, *, values: int = 1) -> list[float]:
     """
     Return a random float within finite interval.
     """
-    if abs(interval.adjusted_lower_bound) == float("inf") or abs(
-        interval.upper_bound
-    ) == float("inf"):
+    if math.isinf(interval.lower_bound) or math.isinf(interval.upper_bound):
         raise IntervalValueError("bounds of interval", "finite", f"was {interval})")
 
-    def _random(interval: Interval) -> float:
-        return random.random() * interval.width + interval.lower_bound
-
-    return [_random(interval) for _ in range(values)]
+    # bound once, outside the loop
+    uniform = random.random
+    width, lower_bound = interval.width, interval.lower_bound
+    return [uniform() * width + lower_bound for _ in range(values)]
 
 
 def rand_interval(
@@ -1024,6 +1909,21 @@ def rand_interval(
     )
 
 
+def rand_intervals(
+    lower_bound_interval: Interval, upper_bound_interval: Interval, n: int
+) -> IntervalArray:
+    """
+    ### Description
+    Like `rand_interval`, but makes n random intervals at once, as an `IntervalArray`.
+    The bounds are drawn in two batches and go straight into the array's buffers, so
+    no `Interval` objects are made along the way.
+    """
+    return IntervalArray(
+        rand_uniform(lower_bound_interval, values=n),
+        rand_uniform(upper_bound_interval, values=n),
+    )
+
+
 def lerp(interval: Interval, t: Number) -> Number:
     return interval.adjusted_lower_bound + t * interval.width
 
@@ -1033,19 +1933,117 @@ def invlerp(interval: Interval, value: Number) -> Number:
 
 
 def remap(interval1: Interval, interval2: Interval, value: Number) -> Number:
-    t: Number = invlerp(interval1, value)
-    return lerp(interval2, t)
+    # lerp(interval2, invlerp(interval1, value)), fused into one expression
+    return interval2.adjusted_lower_bound + (value - interval1.adjusted_lower_bound) * (
+        interval2.width / interval1.width
+    )
+
+
+def make_remapper(
+    interval1: Interval, interval2: Interval
+) -> Callable[[Number], Number]:
+    """
+    ### Description
+    Returns a function equivalent to `remap` between two fixed intervals, with the ratio
+    of their widths divided out once in advance. Build it outside of a loop that remaps
+    many values.
+    """
+    lower_bound1 = interval1.adjusted_lower_bound
+    lower_bound2 = interval2.adjusted_lower_bound
+    ratio = interval2.width / interval1.width
+
+    def _remap(value: Number) -> Number:
+        return lower_bound2 + (value - lower_bound1) * ratio
+
+    return _remap
+
+
+def lerp_fn(interval: Interval) -> Callable[[Number], Number]:
+    """
+    ### Description
+    Returns a function equivalent to `lerp` over a fixed interval, with its bounds read
+    once in advance. Build it outside of a loop that calls it many times.
+    """
+    lower_bound, width = interval.adjusted_lower_bound, interval.width
+
+    def _lerp(t: Number) -> Number:
+        return lower_bound + t * width
+
+    return _lerp
+
+
+def invlerp_fn(interval: Interval) -> Callable[[Number], Number]:
+    """
+    ### Description
+    Returns a function equivalent to `invlerp` over a fixed interval, with its bounds
+    read once in advance. Build it outside of a loop that calls it many times.
+    """
+    lower_bound, width = interval.adjusted_lower_bound, interval.width
+
+    def _invlerp(value: Number) -> Number:
+        return (value - lower_bound) / width
+
+    return _invlerp
+
+
+def lerp_many(interval: Interval, ts: Iterable[Number]) -> list[Number]:
+    """
+    ### Description
+    Applies `lerp` to many values, reading the interval's bounds only once.
+    """
+    return list(map(lerp_fn(interval), ts))
+
+
+def invlerp_many(interval: Interval, values: Iterable[Number]) -> list[Number]:
+    """
+    ### Description
+    Applies `invlerp` to many values, reading the interval's bounds only once.
+    """
+    return list(map(invlerp_fn(interval), values))
+
+
+def remap_many(
+    interval1: Interval, interval2: Interval, values: Iterable[Number]
+) -> list[Number]:
+    """
+    ### Description
+    Applies `remap` to many values, reading both intervals' bounds only once.
+    """
+    return list(map(make_remapper(interval1, interval2), values))
 
 
 def clamp(value: Number, interval: Interval) -> Number:
     """
     Clamp value to within interval.
     """
-    if interval.width == 0:
-        if interval.lower_closure == interval.upper_closure == IntervalType.OPEN:
-            raise IntervalValueError("interval", "not the empty set", f"was {interval}")
-        return interval.lower_bound
-    return min(interval.upper_bound, max(interval.lower_bound, value))
+    if interval.is_empty:
+        raise IntervalValueError("interval", "not the empty set", f"was {interval}")
+    lower_bound, upper_bound = interval.lower_bound, interval.upper_bound
+    if value < lower_bound:
+        return lower_bound
+    if value > upper_bound:
+        return upper_bound
+    return value
+
+
+def clamp_fn(interval: Interval) -> Callable[[Number], Number]:
+    """
+    ### Description
+    Returns a function equivalent to `clamp` to a fixed interval, with its bounds read
+    and checked once in advance. Build it outside of a loop that calls it many times.
+    """
+    if interval.is_empty:
+        raise IntervalValueError("interval", "not the empty set", f"was {interval}")
+    lower_bound, upper_bound = interval.lower_bound, interval.upper_bound
+
+    def _clamp(value: Number) -> Number:
+        if value < lower_bound:
+            return lower_bound
+        if value > upper_bound:
+            return upper_bound
+        return value
+
+    return _clamp
 
 
 def boltzmann(a: Number, xs: Sequence[Number], /, *, base: Number = math.e) -> Number:
@@ -1057,7 +2055,26 @@ def boltzmann(a: Number, xs: Sequence[Number], /, *, base: Number = math.e) -> N
 
     Only change the base parameter if you know what you're doing.
     """
-    return sum(x * base ** (a * x) for x in xs) / sum(base ** (a * x) for x in xs)
+    # One pass, with each weight computed once and used for both sums
+    numerator = denominator = 0.0
+    for x in xs:
+        weight = base ** (a * x)
+        numerator += x * weight
+        denominator += weight
+    return numerator / denominator
+
+
+def _boltzmann2(a: Number, x: Number, y: Number) -> Number:
+    """
+    ### Description
+    A private function. `boltzmann(a, (x, y))` for exactly two numbers, using
+    `math.exp` directly. The larger exponent is subtracted from both before
+    exponentiating, which doesn't change the result but keeps large a from overflowing.
+    """
+    ax, ay = a * x, a * y
+    shift = ax if ax > ay else ay
+    ex, ey = math.exp(ax - shift), math.exp(ay - shift)
+    return (x * ex + y * ey) / (ex + ey)
 
 
 def smooth_clamp(value: Number, interval: Interval, a: Number) -> Number:
@@ -1066,8 +2083,8 @@ def smooth_clamp(value: Number, interval: Interval, a: Number) -> Number:
     Uses the Boltzmann operator to differentiably clamp to an interval.
     """
 
-    return boltzmann(
-        -a, (interval.upper_bound, boltzmann(a, (interval.lower_bound, value)))
+    return _boltzmann2(
+        -a, interval.upper_bound, _boltzmann2(a, interval.lower_bound, value)
     )
 
 
@@ -1,6 +1,8 @@
 import pytest
 from intervals import (
     Interval,
+    IntervalArray,
+    IntervalIndex,
     IntervalError,
     IntervalTypeError,
     IntervalValueError,
@@ -8,6 +10,9 @@ from intervals import (
     EMPTY_SET,
     UNIT,
     POSITIVE_REALS,
+    NEGATIVE_REALS,
+    NEGATIVE_UNIT,
+    REALS,
     UNIT_DISK,
 )
 
@@ -52,6 +57,12 @@ def test_str() -> None:
     assert POSITIVE_REALS == Interval.from_string("[0, ]")
 
 
+def test_constants() -> None:
+    assert NEGATIVE_UNIT == Interval.from_string("(-1, 0]")
+    assert NEGATIVE_REALS == Interval.from_string("[, 0]")
+    assert REALS == Interval.from_string("[,]")
+
+
 def test_repr() -> None:
     w = Interval(
         0, 5, lower_closure=IntervalType.CLOSED, upper_closure=IntervalType.CLOSED
@@ -178,6 +189,44 @@ def test_infinite() -> None:
     assert ~x * -1 == y
 
 
+# open bounds leave out just the bound itself, at any magnitude
+def test_open_bounds() -> None:
+    from itertools import islice
+
+    inf = float("inf")
+    x = Interval(0, inf, upper_closure=IntervalType.OPEN)
+
+    assert x.adjusted_upper_bound == inf
+    assert list(islice(x.step(1), 3)) == [0, 1, 2]
+    assert IntervalArray.from_intervals([x]).adjusted_upper_bounds[0] == inf
+    assert 1e-300 in Interval(0, 1, lower_closure=IntervalType.OPEN)
+    assert 1e20 not in Interval(0, 1e20)
+
+
+# the Python 3.8 fallback for math.nextafter moves open bounds by one float too
+def test_nextafter_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    import sys
+
+    from intervals import intervals as module
+
+    inf = float("inf")
+    nextafter = module._nextafter_py38
+
+    assert nextafter(1.0, inf) == 1 + 2**-52
+    assert nextafter(1.0, -inf) == 1 - 2**-53
+    assert nextafter(-1.0, inf) == -1 + 2**-53
+    assert nextafter(0.0, -inf) == -5e-324
+    assert nextafter(inf, -inf) == sys.float_info.max
+    assert nextafter(2.0, 2.0) == 2.0
+
+    monkeypatch.setattr(module, "_nextafter", nextafter)
+    y = Interval(1, 2, lower_closure=IntervalType.OPEN)
+    assert (y.adjusted_lower_bound, y.adjusted_upper_bound) == (
+        1 + 2**-52,
+        2 - 2**-52,
+    )
+
+
 def test_helper_round() -> None:
     assert Interval._round(-3.0, 0, -1) == -3
     assert Interval._round(-3.5, 0, -1) == -4
@@ -185,6 +234,31 @@ def test_helper_round() -> None:
     assert Interval._round(+3.0, 0, +1) == +3
     assert Interval._round(+3.5, 0, +1) == +4
     assert Interval._round(+3.5, 0, -1) == +3
+    # values already on the grid stay put, even when x * scale is inexact
+    assert Interval._round_scaled(0.3, 10, +1) == 0.3
+    assert Interval._round_scaled(0.7, 10, +1) == 0.7
+    assert Interval._round_scaled(2.2, 10**6, +1) == 2.2
+    assert Interval._round_scaled(0.35, 10, -1) == 0.3
+    assert Interval._round_scaled(0.35, 10, +1) == 0.4
+
+
+def test_floor_ceil() -> None:
+    import math
+
+    y = Interval(0.25, 2.2)
+    assert str(math.floor(y)) == "(0, 2]"
+    assert str(math.ceil(y)) == "(1, 3]"
+    assert str(y.__floor__(1)) == "(0.2, 2.2]"
+    assert str(y.__ceil__(1)) == "(0.3, 2.2]"
+    # bounds already at the precision stay put
+    assert str(y.__ceil__(6)) == "(0.25, 2.2]"
+
+
+# bounds too large to scale by the precision are left as they are
+def test_round_large() -> None:
+    assert round(Interval(0.5, 1.5e307), 3) == Interval(0.5, 1.5e307)
+    assert round(Interval(0.25, 1.5), 400) == Interval(0.25, 1.5)
+    assert Interval._round_scaled(1e300 / 3, 10**10, +1) == 1e300 / 3
 
 
 # real world example
@@ -200,7 +274,206 @@ def test_as_plus_minus() -> None:
     assert str(Interval.from_string(x.as_plus_minus(precision=3))) == "[0.0, 5.0)"
 
 
+# equal numbers can format differently, whatever was formatted before
+def test_as_plus_minus_types() -> None:
+    from fractions import Fraction
+
+    assert Interval(0.0, 1.0).as_plus_minus() == "0.5 ± 0.5"
+    assert Interval(Fraction(0), Fraction(1)).as_plus_minus() == "1/2 ± 1/2"
+    assert Interval(0.0, 1.0).as_plus_minus() == "0.5 ± 0.5"
+    assert Interval(0.0, 0.0).closed().as_plus_minus() == "0.0 ± 0.0"
+    assert Interval(-0.0, -0.0).closed().as_plus_minus() == "-0.0 ± 0.0"
+
+
 # step can't be the identity element
 def test_step_zero_fail() -> None:
     with pytest.raises(IntervalValueError):
         print(list(x.step(0)))
+
+
+def test_union_many() -> None:
+    intervals = [
+        Interval(4, 6),
+        Interval(0, 2),
+        Interval(1, 3),
+        Interval(3, 4),
+        EMPTY_SET,
+    ]
+    assert Interval.union_many(intervals) == [Interval(0, 6)]
+    assert Interval.union_many([Interval(5, 6), Interval(0, 1)]) == [
+        Interval(0, 1),
+        Interval(5, 6),
+    ]
+    assert Interval.union_many([]) == []
+    assert Interval.union_many(
+        [Interval(0, 5).closed(), Interval(), Interval(1, 2)]
+    ) == [Interval(0, 5).closed()]
+
+
+# intervals that touch at two open bounds don't contain the point between them
+def test_union_many_open() -> None:
+    a = Interval(0, 1, lower_closure=IntervalType.OPEN)
+    b = Interval(1, 2, lower_closure=IntervalType.OPEN)
+    assert Interval.union_many([a, b]) == [a, b]
+    assert Interval.union_many([a, b.closed()]) == [
+        Interval(
+            0, 2, lower_closure=IntervalType.OPEN, upper_closure=IntervalType.CLOSED
+        )
+    ]
+
+
+def test_intersect_many() -> None:
+    y = Interval(0, 5, lower_closure=IntervalType.OPEN)  # (0, 5)
+    z = Interval(3, 6, upper_closure=IntervalType.CLOSED)  # [3, 6]
+    assert Interval.intersect_many([y, z, UNIT_DISK + 4]) == Interval(3, 5)
+    assert Interval.intersect_many([UNIT, UNIT + 1]) == EMPTY_SET
+    assert Interval.intersect_many([]) is REALS
+
+
+# no-op arithmetic returns the interval itself
+def test_identity_shortcuts() -> None:
+    assert x + 0 is x
+    assert 0 + x is x
+    assert x - 0 is x
+    assert x * 1 is x
+    assert x / 1 is x
+    assert x**1 is x
+
+
+# parsing is cached, but each call still builds its own interval
+def test_from_string_cache() -> None:
+    a = Interval.from_string("[0, 5)")
+    assert a is not Interval.from_string("[0, 5)")
+    a.lower_bound = 3
+    assert Interval.from_string("[0, 5)") == x
+
+
+# malformed strings raise the same error in either form
+def test_from_string_errors() -> None:
+    for string in ["[a, b]", "1 +- 2 +- 3", "a pm b", "[0, 5", ""]:
+        with pytest.raises(IntervalValueError):
+            Interval.from_string(string)
+
+
+def test_from_strings() -> None:
+    strings = ["[0, 5)", "(1..2]", "3 +- 2", "[,]", "[0, 5)"]
+    assert Interval.from_strings(strings) == [
+        Interval.from_string(string) for string in strings
+    ]
+    with pytest.raises(IntervalValueError):
+        Interval.from_strings(["[0, 5)", "five"])
+
+
+def test_from_plus_minus_many() -> None:
+    strings = ["1.79 +- 0.005", "3pm2", "-1 ± 1", "0 +/- 0.5", "3 + - 2", "2 P/M 1"]
+    assert Interval.from_plus_minus_many(strings) == [
+        Interval.from_string(string) for string in strings
+    ]
+    with pytest.raises(IntervalValueError):
+        Interval.from_plus_minus_many(["[0, 5)"])
+
+
+def test_hash() -> None:
+    assert hash(Interval(0, 5)) == hash(x)
+    assert len({x, Interval(0, 5), Interval(0.0, 5.0), UNIT}) == 2
+    assert {x: "x"}[Interval.from_string("[0, 5)")] == "x"
+
+
+# the cached hash follows the bounds when an interval is set up again
+def test_hash_cache() -> None:
+    y = Interval(0, 5)
+    assert hash(y) == hash(x)
+    y.__init__(1, 2)
+    assert hash(y) == hash(Interval(1, 2))
+    assert y in {Interval(1, 2)}
+
+
+def test_interval_array() -> None:
+    intervals = [UNIT, UNIT_DISK, EMPTY_SET, x]
+    array = IntervalArray.from_intervals(intervals)
+    assert len(array) == 4
+    assert array.to_intervals() == intervals
+    assert array == IntervalArray(
+        [0, -1, 0, 0], [1, 1, 0, 5], [1, 1, 0, 1], [0, 1, 0, 0]
+    )
+    assert array.contains(1) == [1 in interval for interval in intervals]
+    assert array.intersects(Interval(1, 2)) == [
+        interval.intersects(Interval(1, 2)) for interval in intervals
+    ]
+    assert array.intersecting_indices(Interval(1, 2)) == [1, 3]
+    assert IntervalArray([0, 6], [5, 2]).clamp([6, 1]) == [5, 2]
+
+
+# the sweep finds exactly the pairs that a check of every pair would
+def test_overlapping_pairs() -> None:
+    xs = [Interval(i, i + 3) for i in range(0, 20, 2)] + [EMPTY_SET, UNIT_DISK]
+    ys = [Interval(5, 9), UNIT, Interval(-4, -1), Interval(3, 3).closed(), REALS]
+    pairs = IntervalArray.from_intervals(xs).overlapping_pairs(
+        IntervalArray.from_intervals(ys)
+    )
+    assert list(zip(*pairs)) == [
+        (i, j) for i, a in enumerate(xs) for j, b in enumerate(ys) if a.intersects(b)
+    ]
+    assert IntervalArray([], []).overlapping_pairs(IntervalArray([0], [1])) == ([], [])
+
+
+# elementwise arithmetic agrees with the arithmetic of Interval
+def test_interval_array_math() -> None:
+    xs = [Interval(1, 2), Interval(-3, 4), Interval(0.5, 0.75)]
+    ys = [Interval(2, 5), Interval(-1, 1), Interval(-4, -2)]
+    x_array = IntervalArray.from_intervals(xs)
+    y_array = IntervalArray.from_intervals(ys)
+    assert (x_array + y_array).to_intervals() == [a + b for a, b in zip(xs, ys)]
+    assert (x_array - y_array).to_intervals() == [a - b for a, b in zip(xs, ys)]
+    assert (x_array * y_array).to_intervals() == [a * b for a, b in zip(xs, ys)]
+    assert (x_array / y_array).to_intervals() == [a / b for a, b in zip(xs, ys)]
+    assert (x_array + 2).to_intervals() == [a + 2 for a in xs]
+    assert (x_array - 2).to_intervals() == [a - 2 for a in xs]
+    assert (-3 * x_array).to_intervals() == [a * -3 for a in xs]
+    assert (x_array / 4).to_intervals() == [a / 4 for a in xs]
+
+
+def test_interval_index() -> None:
+    intervals = [Interval(i, i + 3) for i in range(0, 100, 2)] + [EMPTY_SET, UNIT_DISK]
+    index = IntervalIndex(intervals)
+    query = Interval(10, 14)
+    assert index.overlapping(query) == sorted(
+        (interval for interval in intervals if interval.intersects(query)),
+        key=lambda interval: interval.lower_bound,
+    )
+    assert index.overlapping_point(-1) == [UNIT_DISK]
+    assert index.overlapping_point(6) == [Interval(4, 7), Interval(6, 9)]
+    assert IntervalIndex([]).overlapping(UNIT) == []
+
+
+def test_step_array() -> None:
+    assert list(UNIT_DISK.step_array(1 / 2)) == list(UNIT_DISK.step(1 / 2))
+    assert list(x.step_array(-1, start=5)) == [4, 3, 2, 1, 0]
+    with pytest.raises(IntervalValueError):
+        POSITIVE_REALS.step_array(1)
+
+
+# steps too small for floats to resolve near the bounds are taken lazily, not counted
+def test_step_huge_limit() -> None:
+    from itertools import islice
+
+    assert Interval._step_count(0, 1, 1e25) is None
+    assert list(islice(Interval(0, 1e300).step(1), 3)) == [0, 1, 2]
+    assert list(islice(Interval(0, 1e300).steps(1e300), 3)) == [0, 1, 2]
+    with pytest.raises(IntervalValueError):
+        Interval(0, 1e300).step_array(1)
+    # the distance between the bounds overflows, but each step doesn't
+    wide = Interval(-1e308, 1e308).closed()
+    assert Interval._step_count(-1e308, 1e307, 1e308) is None
+    values = list(wide.step(1e307))
+    assert values[:2] == [-1e308, -1e308 + 1e307]
+    assert all(value in wide for value in values)
+    with pytest.raises(IntervalValueError):
+        wide.step_array(1e307)
+
+
+def test_is_empty() -> None:
+    assert EMPTY_SET.is_empty
+    assert (UNIT & (UNIT + 2)).is_empty
+    assert not Interval(3, 3).closed().is_empty
+    assert not x.is_empty
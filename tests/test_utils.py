@@ -4,10 +4,20 @@ from intervals import (
     IntervalValueError,
     clamp,
     rand_uniform,
+    rand_intervals,
     lerp,
     invlerp,
+    remap,
+    lerp_many,
+    invlerp_many,
+    remap_many,
+    make_remapper,
+    lerp_fn,
+    invlerp_fn,
+    clamp_fn,
 )
 from intervals import Number, EMPTY_SET
+from intervals.intervals import smooth_clamp
 
 x = Interval(0, 5)
 
@@ -23,6 +33,13 @@ def test_rand_uniform() -> None:
         assert x.lower_bound <= rand_uniform(x)[0] <= x.upper_bound
 
 
+def test_rand_intervals() -> None:
+    intervals = rand_intervals(x, Interval(3, 10), 100)
+    assert len(intervals) == 100
+    for interval in intervals:
+        assert 0 <= interval.lower_bound <= interval.upper_bound <= 10
+
+
 # lerp and invlerp are inverses of each other, so applying both needs to do nothing
 def test_lerp_invlerp_inverses() -> None:
     t0 = 0.5
@@ -31,6 +48,31 @@ def test_lerp_invlerp_inverses() -> None:
     assert t0 == t1
 
 
+# the batched variants agree with calling the scalar functions one value at a time
+def test_many_variants() -> None:
+    y = Interval(-2, 8)
+    ts = [0, 0.25, 0.5, 1]
+    assert lerp_many(x, ts) == [lerp(x, t) for t in ts]
+    assert invlerp_many(x, ts) == [invlerp(x, t) for t in ts]
+    assert remap_many(x, y, ts) == [remap(x, y, t) for t in ts]
+
+
+def test_make_remapper() -> None:
+    y = Interval(-2, 8)
+    remapper = make_remapper(x, y)
+    assert remapper(0) == -2
+    assert remapper(5) == 8
+    assert remapper(1.5) == remap(x, y, 1.5)
+
+
+def test_fn_variants() -> None:
+    assert [lerp_fn(x)(t) for t in (0, 0.5, 1)] == [lerp(x, t) for t in (0, 0.5, 1)]
+    assert invlerp_fn(x)(2) == invlerp(x, 2)
+    assert [clamp_fn(x)(value) for value in (-1, 3, 6)] == [0, 3, 5]
+    with pytest.raises(IntervalValueError):
+        clamp_fn(EMPTY_SET)
+
+
 # no value can be clamped to the empty set
 def test_clamp_fail() -> None:
     with pytest.raises(IntervalValueError):
@@ -44,3 +86,11 @@ def test_invlerp_fail() -> None:
     with pytest.raises(ZeroDivisionError):
         x1: Interval = EMPTY_SET
         invlerp(x1, 5)
+
+
+# large a or far-out values used to overflow the exponentials
+def test_smooth_clamp_overflow() -> None:
+    assert smooth_clamp(3, Interval(0, 1), 1000) == pytest.approx(1)
+    assert smooth_clamp(-3, Interval(0, 1), 1000) == pytest.approx(0)
+    assert smooth_clamp(0.5, Interval(0, 1), 1000) == pytest.approx(0.5)
+    assert smooth_clamp(1e6, Interval(0, 1), 5) == pytest.approx(1)